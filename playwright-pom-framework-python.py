@@ -8,14 +8,23 @@
 # │   ├── job_details_page.py
 # │   ├── registration_page.py
 # │   └── profile_page.py
+# ├── async_pages/
+# │   ├── base_page.py
+# │   ├── home_page.py
+# │   ├── job_search_page.py
+# │   └── job_details_page.py
 # ├── tests/
 # │   ├── test_login.py
 # │   ├── test_search.py
 # │   ├── test_registration.py
 # │   └── test_profile.py
+# ├── async_tests/
+# │   ├── conftest.py
+# │   └── test_search.py
 # ├── utils/
 # │   ├── test_data.py
-# │   └── helpers.py
+# │   ├── helpers.py
+# │   └── context_setup.py
 # ├── conftest.py
 # ├── pytest.ini
 # └── requirements.txt
@@ -27,6 +36,8 @@
 playwright==1.40.0
 pytest==7.4.3
 pytest-playwright==0.4.0
+pytest-xdist==3.5.0
+pytest-asyncio==0.21.1
 python-dotenv==1.0.0
 faker==19.10.0
 """
@@ -40,9 +51,12 @@ testpaths = tests
 python_files = test_*.py
 python_classes = Test*
 python_functions = test_*
+addopts = -n auto --dist=loadfile
 markers =
     smoke: marks tests as smoke tests
     regression: marks tests as regression tests
+    home_navigation: marks tests that reach the page through the home page links
+    har: marks read-only tests whose API traffic can be recorded and replayed via HAR_MODE
 """
 
 # 3. Let's create the conftest.py file:
@@ -53,16 +67,47 @@ from playwright.sync_api import sync_playwright
 from dotenv import load_dotenv
 import os
 
+from pages.login_page import LoginPage
+from utils.context_setup import (
+    DEFAULT_TIMEOUT,
+    HAR_URL_FILTER,
+    har_mode,
+    har_record_args,
+    har_replay_path,
+    is_unneeded_request,
+    should_block_assets,
+)
+from utils.helpers import ResultsSink
+from utils.test_data import VALID_USERS
+
 # Load environment variables from .env file
 load_dotenv()
 
+# Tests are sharded across pytest-xdist worker processes (see pytest.ini).
+# Playwright's sync API is not thread-safe but is safe across processes, and
+# every fixture below is created per worker, so nothing is shared between them.
+# Tests that log in as VALID_USER therefore run concurrently against the same
+# account; keep those flows tolerant of parallel sessions or use the
+# `valid_user` fixture, which hands each worker its own account.
+
 @pytest.fixture(scope="session")
-def browser_type_launch_args():
-    """Return additional arguments for browser launch."""
-    return {
-        "headless": False,
-        "slow_mo": 100,
+def browser_type_launch_args(browser_name):
+    """Return additional arguments for browser launch.
+
+    Runs headless by default; set HEADED=1 to watch the browser locally.
+    """
+    launch_args = {
+        "headless": os.getenv("HEADED") != "1",
+        "slow_mo": 0,
     }
+    # These switches only exist in Chromium
+    if browser_name == "chromium":
+        launch_args["args"] = [
+            "--disable-blink-features=AutomationControlled",
+            "--disable-dev-shm-usage",
+            "--no-sandbox",
+        ]
+    return launch_args
 
 @pytest.fixture(scope="session")
 def browser_context_args():
@@ -75,19 +120,88 @@ def browser_context_args():
         "ignore_https_errors": True,
     }
 
-@pytest.fixture
-def context(browser):
-    """Create a new browser context with a screenshot path."""
-    context = browser.new_context(
-        record_video_dir="videos/",
-        record_har_path=None,
-    )
-    
+@pytest.fixture(scope="session")
+def browser(browser_type, browser_type_launch_args):
+    """Launch one browser per worker and share it across all tests."""
+    browser = browser_type.launch(**browser_type_launch_args)
+    yield browser
+    browser.close()
+
+def _recording_args(request):
+    """Return the video/HAR recording arguments enabled via the environment.
+    
+    Nothing is recorded unless RECORD_VIDEO_DIR, RECORD_HAR_DIR or
+    HAR_MODE=record is set.
+    """
+    args = {}
+    record_video_dir = os.getenv("RECORD_VIDEO_DIR")
+    if record_video_dir:
+        args["record_video_dir"] = record_video_dir
+    record_har_dir = os.getenv("RECORD_HAR_DIR")
+    if record_har_dir:
+        args["record_har_path"] = os.path.join(record_har_dir, f"{request.node.name}.har")
+    # Recording a HAR for replay takes precedence over the debugging HAR
+    args.update(har_record_args(request.node))
+    return args
+
+def _block_unneeded_requests(route):
+    """Abort static assets and trackers; hand every other request on."""
+    if is_unneeded_request(route.request):
+        route.abort()
+    else:
+        # fallback() rather than continue_() so other routes can still handle it
+        route.fallback()
+
+def _prepare_context(context, node=None):
+    """Apply the settings shared by every context the suite opens."""
     # Set default navigation timeout
-    context.set_default_timeout(30000)
+    context.set_default_timeout(DEFAULT_TIMEOUT)
     
-    yield context
+    if should_block_assets():
+        context.route("**/*", _block_unneeded_requests)
+    
+    replay_path = har_replay_path(node) if node is not None else None
+    if replay_path:
+        context.route_from_har(replay_path, url=HAR_URL_FILTER, not_found="fallback")
+
+def _track_videos(context):
+    """Collect the video of every page the context opens, closed or not."""
+    videos = []
+    
+    def on_page(page):
+        if page.video:
+            videos.append(page.video)
+    
+    context.on("page", on_page)
+    return videos
+
+def _close_context(context, request, recording_args, videos):
+    """Close the context, keeping its recordings only if the test failed."""
     context.close()
+    
+    # rep_setup/rep_call are set on the item by pytest-playwright's report hook
+    reports = (getattr(request.node, "rep_setup", None), getattr(request.node, "rep_call", None))
+    if any(report is not None and report.failed for report in reports):
+        return
+    
+    for video in videos:
+        video.delete()
+    # HARs recorded for replay are kept regardless of the outcome
+    har_path = recording_args.get("record_har_path")
+    if har_path and har_mode(request.node) != "record" and os.path.exists(har_path):
+        os.remove(har_path)
+
+@pytest.fixture
+def context(browser, browser_context_args, request):
+    """Create a new browser context, recording video/HAR only when enabled."""
+    # Contexts are cheap, so every test still gets a fresh, isolated one
+    recording_args = _recording_args(request)
+    context = browser.new_context(**browser_context_args, **recording_args)
+    videos = _track_videos(context)
+    _prepare_context(context, request.node)
+    
+    yield context
+    _close_context(context, request, recording_args, videos)
 
 @pytest.fixture
 def page(context):
@@ -95,28 +209,123 @@ def page(context):
     page = context.new_page()
     yield page
 
+@pytest.fixture(scope="session")
+def authenticated_storage_state(browser, browser_context_args, valid_user, tmp_path_factory):
+    """Log in once per worker and return the path of the saved storage state.
+    
+    Set AUTH_STORAGE_STATE to an existing storage state file (e.g. cookies
+    exported by CI) to skip the UI login entirely.
+    """
+    existing_state = os.getenv("AUTH_STORAGE_STATE")
+    if existing_state:
+        return existing_state
+    
+    context = browser.new_context(**browser_context_args)
+    try:
+        _prepare_context(context)
+        page = context.new_page()
+        
+        login_page = LoginPage(page)
+        login_page.navigate()
+        login_page.login(valid_user["email"], valid_user["password"])
+        page.wait_for_url("**/my-bdjobs/**")
+        
+        state_path = tmp_path_factory.mktemp("auth") / "state.json"
+        context.storage_state(path=state_path)
+    finally:
+        context.close()
+    return state_path
+
+@pytest.fixture
+def authed_context(browser, browser_context_args, authenticated_storage_state, request):
+    """Create a browser context that is already logged in."""
+    recording_args = _recording_args(request)
+    context = browser.new_context(
+        **browser_context_args,
+        **recording_args,
+        storage_state=authenticated_storage_state,
+    )
+    videos = _track_videos(context)
+    _prepare_context(context, request.node)
+    
+    yield context
+    _close_context(context, request, recording_args, videos)
+
+@pytest.fixture
+def authed_page(authed_context):
+    """Create a new logged in page."""
+    page = authed_context.new_page()
+    yield page
+
+@pytest.fixture(scope="session")
+def results_sink(worker_id):
+    """Collect results for the whole run and write them in one file per worker."""
+    with ResultsSink(f"run_{worker_id}") as sink:
+        yield sink
+
+@pytest.fixture(scope="session")
+def valid_user(worker_id):
+    """Return the login account reserved for the current xdist worker."""
+    # worker_id is "master" when xdist is disabled, otherwise "gw0", "gw1", ...
+    index = 0 if worker_id == "master" else int(worker_id.lstrip("gw"))
+    return VALID_USERS[index % len(VALID_USERS)]
+
 # 4. Let's create the base_page.py file:
 
 # pages/base_page.py
 import logging
-from playwright.sync_api import Page, TimeoutError
+from playwright.sync_api import Locator, Page, TimeoutError
+
+class cached_locator:
+    """Declare a page object's Locator at class level and build it lazily.
+    
+    The selector is shared by every instance; the Locator is created on first
+    access and cached on the instance, like functools.cached_property.
+    Locators resolve to their first match, as the page-level methods did; pass
+    all=True for collections that are iterated, counted or indexed.
+    """
+    
+    def __init__(self, selector, all=False):
+        self.selector = selector
+        self.all = all
+    
+    def __set_name__(self, owner, name):
+        self.name = name
+    
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        locator = instance.page.locator(self.selector)
+        if not self.all:
+            locator = locator.first
+        instance.__dict__[self.name] = locator
+        return locator
 
 class BasePage:
-    """Base page object that all page objects inherit from."""
+    """Base page object that all page objects inherit from.
+    
+    Subclasses declare their elements with cached_locator, so a Locator is only
+    built the first time a test touches it.
+    """
+    
+    BASE_URL = "https://bdjobs.com"
+    logger = logging.getLogger(__name__)
     
     def __init__(self, page: Page):
         self.page = page
-        self.logger = logging.getLogger(__name__)
-        self.base_url = "https://bdjobs.com"
     
     def navigate(self, path=""):
         """Navigate to a specific URL path."""
-        url = f"{self.base_url}/{path}"
+        url = f"{self.BASE_URL}/{path}"
         self.logger.info(f"Navigating to: {url}")
         self.page.goto(url)
     
-    def wait_for_page_load(self):
-        """Wait for page to finish loading."""
+    def wait_for_networkidle(self):
+        """Wait until the network has been idle for 500 ms.
+        
+        Slow on pages with ads and analytics; prefer waiting for the element
+        the next step needs and only opt into this when nothing else fits.
+        """
         self.page.wait_for_load_state("networkidle")
     
     def get_title(self):
@@ -131,45 +340,62 @@ class BasePage:
         """Take a screenshot of the current page."""
         self.page.screenshot(path=f"screenshots/{name}.png")
     
+    def locator(self, selector):
+        """Return a Locator for a selector string, or the Locator itself.
+        
+        Selector strings resolve to their first match. Locators are used as
+        given; cached_locator already narrows single elements to their first match.
+        """
+        if isinstance(selector, Locator):
+            return selector
+        return self.page.locator(selector).first
+    
     def is_element_visible(self, selector):
         """Check if an element is visible."""
         try:
-            return self.page.is_visible(selector)
+            return self.locator(selector).is_visible()
         except TimeoutError:
             return False
 
     def click(self, selector):
         """Click on an element."""
-        self.page.click(selector)
+        self.locator(selector).click()
     
     def fill(self, selector, text):
         """Fill a form field."""
-        self.page.fill(selector, text)
+        self.locator(selector).fill(text)
     
     def select_option(self, selector, value):
         """Select an option from a dropdown."""
-        self.page.select_option(selector, value)
+        self.locator(selector).select_option(value)
     
     def wait_for_selector(self, selector, state="visible", timeout=10000):
         """Wait for an element to be in the specified state."""
-        self.page.wait_for_selector(selector, state=state, timeout=timeout)
+        self.locator(selector).wait_for(state=state, timeout=timeout)
+    
+    def click_and_wait_for_url_change(self, selector):
+        """Click on an element and wait until the page URL changes."""
+        current_url = self.page.url
+        self.click(selector)
+        self.page.wait_for_url(lambda url: url != current_url)
 
 # 5. Let's create the home_page.py file:
 
 # pages/home_page.py
-from pages.base_page import BasePage
+from pages.base_page import BasePage, cached_locator
+from pages.job_search_page import JobSearchPage
 
 class HomePage(BasePage):
     """Page object for the home page."""
     
-    def __init__(self, page):
-        super().__init__(page)
-        self.search_box = "input[name='keyword']"
-        self.search_button = "button.search-btn"
-        self.login_link = "a.loginText"
-        self.registration_link = "a.signupText"
-        self.job_category_links = ".category-name"
-        self.featured_jobs_section = ".featured-jobs"
+    search_box = cached_locator("input[name='keyword']")
+    search_button = cached_locator("button.search-btn")
+    login_link = cached_locator("a.loginText")
+    registration_link = cached_locator("a.signupText")
+    job_category_links = cached_locator(".category-name", all=True)
+    featured_jobs_section = cached_locator(".featured-jobs")
+    # Searches land on the job search page, so wait on its results container
+    search_results_container = JobSearchPage.search_results_container
     
     def navigate(self):
         """Navigate to the home page."""
@@ -179,23 +405,22 @@ class HomePage(BasePage):
         """Search for a job using a keyword."""
         self.fill(self.search_box, keyword)
         self.click(self.search_button)
-        self.wait_for_page_load()
+        self.wait_for_selector(self.search_results_container)
     
     def click_login(self):
         """Click on the login link."""
         self.click(self.login_link)
-        self.wait_for_page_load()
+        self.page.wait_for_url("**/login**")
     
     def click_registration(self):
         """Click on the registration link."""
         self.click(self.registration_link)
-        self.wait_for_page_load()
+        self.page.wait_for_url("**/register**")
     
     def select_job_category(self, category):
         """Select a job category."""
-        category_locator = f"{self.job_category_links}:has-text('{category}')"
-        self.click(category_locator)
-        self.wait_for_page_load()
+        self.click(self.job_category_links.filter(has_text=category).first)
+        self.wait_for_selector(self.search_results_container)
     
     def verify_featured_jobs_visible(self):
         """Verify that featured jobs section is visible."""
@@ -204,18 +429,17 @@ class HomePage(BasePage):
 # 6. Let's create the login_page.py file:
 
 # pages/login_page.py
-from pages.base_page import BasePage
+from playwright.sync_api import TimeoutError
+from pages.base_page import BasePage, cached_locator
 
 class LoginPage(BasePage):
     """Page object for the login page."""
     
-    def __init__(self, page):
-        super().__init__(page)
-        self.email_input = "input[name='email']"
-        self.password_input = "input[name='password']"
-        self.login_button = "button[type='submit']"
-        self.error_message = ".error-message"
-        self.forgot_password_link = "a:has-text('Forgot Password')"
+    email_input = cached_locator("input[name='email']")
+    password_input = cached_locator("input[name='password']")
+    login_button = cached_locator("button[type='submit']")
+    error_message = cached_locator(".error-message")
+    forgot_password_link = cached_locator("a:has-text('Forgot Password')")
     
     def navigate(self):
         """Navigate to the login page."""
@@ -226,113 +450,129 @@ class LoginPage(BasePage):
         self.fill(self.email_input, email)
         self.fill(self.password_input, password)
         self.click(self.login_button)
-        self.wait_for_page_load()
     
     def get_error_message(self):
         """Get error message if login fails."""
-        if self.is_element_visible(self.error_message):
-            return self.page.text_content(self.error_message)
-        return None
+        try:
+            self.wait_for_selector(self.error_message, timeout=5000)
+        except TimeoutError:
+            return None
+        return self.error_message.text_content()
     
     def click_forgot_password(self):
         """Click on forgot password link."""
-        self.click(self.forgot_password_link)
-        self.wait_for_page_load()
+        self.click_and_wait_for_url_change(self.forgot_password_link)
 
 # 7. Let's create the job_search_page.py file:
 
 # pages/job_search_page.py
-from pages.base_page import BasePage
+import re
+from playwright.sync_api import expect
+from pages.base_page import BasePage, cached_locator
+
+DIGITS_RE = re.compile(r'\d+')
+JOB_DETAILS_URL_RE = re.compile(r'/job-details')
+
+# Resource types that can carry a refreshed result list
+RESULTS_RESOURCE_TYPES = {"document", "xhr", "fetch"}
+
+def is_search_results_response(response):
+    """Return whether a response from the site can carry updated search results."""
+    return response.request.resource_type in RESULTS_RESOURCE_TYPES and "bdjobs.com" in response.url
 
 class JobSearchPage(BasePage):
     """Page object for the job search page."""
     
-    def __init__(self, page):
-        super().__init__(page)
-        self.search_results_container = ".search-results-container"
-        self.job_titles = ".job-title-text"
-        self.filter_panel = ".filter-panel"
-        self.category_filter = ".category-filter"
-        self.location_filter = ".location-filter"
-        self.experience_filter = ".experience-filter"
-        self.sort_dropdown = "select.sort-options"
-        self.pagination = ".pagination"
-        self.total_jobs_count = ".total-jobs-count"
+    search_results_container = cached_locator(".search-results-container")
+    job_titles = cached_locator(".job-title-text", all=True)
+    filter_panel = cached_locator(".filter-panel")
+    category_filter = cached_locator(".category-filter")
+    location_filter = cached_locator(".location-filter")
+    experience_filter = cached_locator(".experience-filter")
+    sort_dropdown = cached_locator("select.sort-options")
+    pagination = cached_locator(".pagination")
+    total_jobs_count = cached_locator(".total-jobs-count")
+    
+    def _wait_for_results_update(self, action):
+        """Run an action and wait for the site to answer with refreshed results.
+        
+        Filters, sorting and paging may leave the count or first listing
+        unchanged, so this waits on the response rather than on the text.
+        """
+        with self.page.expect_response(is_search_results_response):
+            action()
     
     def get_search_results_count(self):
         """Get the number of search results."""
-        count_text = self.page.text_content(self.total_jobs_count)
+        count_text = self.total_jobs_count.text_content()
         # Extract numbers from text like "1,234 jobs found"
-        import re
-        numbers = re.findall(r'\d+', count_text.replace(',', ''))
+        numbers = DIGITS_RE.findall(count_text.replace(',', ''))
         if numbers:
             return int(numbers[0])
         return 0
     
     def filter_by_category(self, category):
         """Filter jobs by category."""
-        category_locator = f"{self.category_filter} label:has-text('{category}')"
-        self.click(category_locator)
-        self.wait_for_page_load()
+        self._wait_for_results_update(
+            lambda: self.click(self.category_filter.locator("label", has_text=category).first),
+        )
     
     def filter_by_location(self, location):
         """Filter jobs by location."""
-        location_locator = f"{self.location_filter} label:has-text('{location}')"
-        self.click(location_locator)
-        self.wait_for_page_load()
+        self._wait_for_results_update(
+            lambda: self.click(self.location_filter.locator("label", has_text=location).first),
+        )
     
     def filter_by_experience(self, experience):
         """Filter jobs by experience level."""
-        experience_locator = f"{self.experience_filter} label:has-text('{experience}')"
-        self.click(experience_locator)
-        self.wait_for_page_load()
+        self._wait_for_results_update(
+            lambda: self.click(self.experience_filter.locator("label", has_text=experience).first),
+        )
     
     def sort_by(self, option):
         """Sort search results by the specified option."""
-        self.select_option(self.sort_dropdown, option)
-        self.wait_for_page_load()
+        self._wait_for_results_update(
+            lambda: self.select_option(self.sort_dropdown, option),
+        )
     
     def click_on_job_by_index(self, index):
         """Click on a job by index in the search results."""
-        self.page.nth(self.job_titles, index).click()
-        self.wait_for_page_load()
+        self.job_titles.nth(index).click()
+        expect(self.page).to_have_url(JOB_DETAILS_URL_RE)
     
     def navigate_to_page(self, page_number):
         """Navigate to a specific page in the search results."""
-        page_locator = f"{self.pagination} a:has-text('{page_number}')"
-        self.click(page_locator)
-        self.wait_for_page_load()
+        self._wait_for_results_update(
+            lambda: self.click(self.pagination.locator("a", has_text=re.compile(rf"^\s*{page_number}\s*$"))),
+        )
 
 # 8. Let's create the job_details_page.py file:
 
 # pages/job_details_page.py
-from pages.base_page import BasePage
+from pages.base_page import BasePage, cached_locator
 
 class JobDetailsPage(BasePage):
     """Page object for the job details page."""
     
-    def __init__(self, page):
-        super().__init__(page)
-        self.job_title = ".job-title"
-        self.company_name = ".company-name"
-        self.job_description = ".job-description"
-        self.apply_button = "button:has-text('Apply Now')"
-        self.job_requirements = ".job-requirements"
-        self.job_responsibilities = ".job-responsibilities"
-        self.salary_info = ".salary-info"
+    job_title = cached_locator(".job-title")
+    company_name = cached_locator(".company-name")
+    job_description = cached_locator(".job-description")
+    apply_button = cached_locator("button:has-text('Apply Now')")
+    job_requirements = cached_locator(".job-requirements")
+    job_responsibilities = cached_locator(".job-responsibilities")
+    salary_info = cached_locator(".salary-info")
     
     def get_job_title(self):
         """Get the job title from the job details page."""
-        return self.page.text_content(self.job_title)
+        return self.job_title.text_content()
     
     def get_company_name(self):
         """Get the company name from the job details page."""
-        return self.page.text_content(self.company_name)
+        return self.company_name.text_content()
     
     def click_apply(self):
         """Click on the apply button."""
-        self.click(self.apply_button)
-        self.wait_for_page_load()
+        self.click_and_wait_for_url_change(self.apply_button)
     
     def is_salary_visible(self):
         """Check if salary information is visible."""
@@ -341,69 +581,92 @@ class JobDetailsPage(BasePage):
 # 9. Let's create the registration_page.py file:
 
 # pages/registration_page.py
-from pages.base_page import BasePage
+from playwright.sync_api import TimeoutError
+from pages.base_page import BasePage, cached_locator
+
+# Sets each field's value and fires the events a user edit would, in one round-trip
+_FILL_FIELDS_JS = """(fields) => {
+    for (const [selector, value] of Object.entries(fields)) {
+        const element = document.querySelector(selector);
+        if (element === null) {
+            throw new Error(`missing field ${selector}`);
+        }
+        element.value = value;
+        element.dispatchEvent(new Event('input', {bubbles: true}));
+        element.dispatchEvent(new Event('change', {bubbles: true}));
+    }
+}"""
 
 class RegistrationPage(BasePage):
     """Page object for the registration page."""
     
-    def __init__(self, page):
-        super().__init__(page)
-        self.name_input = "input[name='name']"
-        self.email_input = "input[name='email']"
-        self.password_input = "input[name='password']"
-        self.confirm_password_input = "input[name='confirmPassword']"
-        self.mobile_input = "input[name='mobile']"
-        self.gender_selection = "select[name='gender']"
-        self.register_button = "button[type='submit']"
-        self.terms_checkbox = "input[type='checkbox'][name='terms']"
-        self.error_messages = ".error-message"
+    name_input = cached_locator("input[name='name']")
+    email_input = cached_locator("input[name='email']")
+    password_input = cached_locator("input[name='password']")
+    confirm_password_input = cached_locator("input[name='confirmPassword']")
+    mobile_input = cached_locator("input[name='mobile']")
+    gender_selection = cached_locator("select[name='gender']")
+    register_button = cached_locator("button[type='submit']")
+    terms_checkbox = cached_locator("input[type='checkbox'][name='terms']")
+    error_messages = cached_locator(".error-message", all=True)
     
     def navigate(self):
         """Navigate to the registration page."""
         super().navigate("register")
     
-    def register_user(self, user_data):
-        """Register a new user with the provided data."""
-        self.fill(self.name_input, user_data["name"])
-        self.fill(self.email_input, user_data["email"])
-        self.fill(self.password_input, user_data["password"])
-        self.fill(self.confirm_password_input, user_data["confirm_password"])
-        self.fill(self.mobile_input, user_data["mobile"])
-        self.select_option(self.gender_selection, user_data["gender"])
+    def register_user(self, user_data, per_field=False):
+        """Register a new user with the provided data.
+        
+        The form is populated in a single evaluate call. Pass per_field=True to
+        fill field by field when validation relies on focus/keyboard events.
+        On that single-call path the gender select is set by option value
+        only, whereas select_option also matches option labels.
+        """
+        if per_field:
+            self.fill(self.name_input, user_data["name"])
+            self.fill(self.email_input, user_data["email"])
+            self.fill(self.password_input, user_data["password"])
+            self.fill(self.confirm_password_input, user_data["confirm_password"])
+            self.fill(self.mobile_input, user_data["mobile"])
+            self.select_option(self.gender_selection, user_data["gender"])
+        else:
+            self.page.evaluate(_FILL_FIELDS_JS, {
+                RegistrationPage.name_input.selector: user_data["name"],
+                RegistrationPage.email_input.selector: user_data["email"],
+                RegistrationPage.password_input.selector: user_data["password"],
+                RegistrationPage.confirm_password_input.selector: user_data["confirm_password"],
+                RegistrationPage.mobile_input.selector: user_data["mobile"],
+                RegistrationPage.gender_selection.selector: user_data["gender"],
+            })
         
         if user_data.get("accept_terms", False):
-            self.page.check(self.terms_checkbox)
+            self.terms_checkbox.check()
         
         self.click(self.register_button)
-        self.wait_for_page_load()
     
     def get_error_messages(self):
         """Get all error messages displayed on the registration page."""
-        errors = []
-        error_elements = self.page.query_selector_all(self.error_messages)
-        
-        for element in error_elements:
-            errors.append(element.text_content())
-        
-        return errors
+        try:
+            self.wait_for_selector(self.error_messages.first, timeout=5000)
+        except TimeoutError:
+            return []
+        return self.error_messages.all_text_contents()
 
 # 10. Let's create the profile_page.py file:
 
 # pages/profile_page.py
-from pages.base_page import BasePage
+from pages.base_page import BasePage, cached_locator
 
 class ProfilePage(BasePage):
     """Page object for the user profile page."""
     
-    def __init__(self, page):
-        super().__init__(page)
-        self.profile_name = ".profile-name"
-        self.edit_profile_button = "button:has-text('Edit Profile')"
-        self.profile_sections = ".profile-section"
-        self.resume_download_button = "button:has-text('Download Resume')"
-        self.applied_jobs_tab = "a:has-text('Applied Jobs')"
-        self.saved_jobs_tab = "a:has-text('Saved Jobs')"
-        self.logout_button = "button:has-text('Logout')"
+    profile_name = cached_locator(".profile-name")
+    edit_profile_button = cached_locator("button:has-text('Edit Profile')")
+    profile_sections = cached_locator(".profile-section", all=True)
+    resume_download_button = cached_locator("button:has-text('Download Resume')")
+    applied_jobs_tab = cached_locator("a:has-text('Applied Jobs')")
+    saved_jobs_tab = cached_locator("a:has-text('Saved Jobs')")
+    logout_button = cached_locator("button:has-text('Logout')")
     
     def navigate(self):
         """Navigate to the profile page."""
@@ -411,27 +674,26 @@ class ProfilePage(BasePage):
     
     def get_profile_name(self):
         """Get the profile name from the profile page."""
-        return self.page.text_content(self.profile_name)
+        return self.profile_name.text_content()
     
     def click_edit_profile(self):
         """Click on the edit profile button."""
-        self.click(self.edit_profile_button)
-        self.wait_for_page_load()
+        self.click_and_wait_for_url_change(self.edit_profile_button)
     
     def view_applied_jobs(self):
         """View applied jobs section."""
         self.click(self.applied_jobs_tab)
-        self.wait_for_page_load()
+        self.page.wait_for_url(lambda url: "applied" in url)
     
     def view_saved_jobs(self):
         """View saved jobs section."""
         self.click(self.saved_jobs_tab)
-        self.wait_for_page_load()
+        self.page.wait_for_url(lambda url: "saved" in url)
     
     def logout(self):
         """Click on the logout button."""
         self.click(self.logout_button)
-        self.wait_for_page_load()
+        self.page.wait_for_url(lambda url: "my-bdjobs" not in url)
 
 # 11. Let's create the test_data.py file:
 
@@ -443,6 +705,12 @@ VALID_USER = {
     "password": "Password123!"
 }
 
+# Accounts handed out per pytest-xdist worker so parallel logins don't collide.
+# Add more entries to give each worker a dedicated account.
+VALID_USERS = [
+    VALID_USER,
+]
+
 INVALID_USER = {
     "email": "invalid@example.com",
     "password": "wrongpassword"
@@ -490,11 +758,21 @@ import random
 import string
 import json
 import os
+import warnings
 from datetime import datetime
 from faker import Faker
 
+# Seed once per xdist worker ("gw0", "gw1", ...) so generated data is
+# reproducible for a given worker but still differs between workers.
+_SEED = int(os.getenv("PYTEST_XDIST_WORKER", "gw0").lstrip("gw") or 0)
+random.seed(_SEED)
+Faker.seed(_SEED)
+
 fake = Faker()
 
+RESULTS_DIR = "results"
+os.makedirs(RESULTS_DIR, exist_ok=True)
+
 def generate_random_email():
     """Generate a random email address."""
     timestamp = int(time.time())
@@ -507,79 +785,129 @@ def generate_random_name():
 def generate_random_password(length=12):
     """Generate a random password."""
     chars = string.ascii_letters + string.digits + string.punctuation
-    return ''.join(random.choice(chars) for _ in range(length))
+    return ''.join(random.choices(chars, k=length))
 
 def generate_random_phone():
     """Generate a random Bangladesh phone number."""
-    return f"017{''.join(random.choice(string.digits) for _ in range(8))}"
+    return f"017{''.join(random.choices(string.digits, k=8))}"
 
 def save_test_results(test_name, results):
     """Save test results to a JSON file."""
-    if not os.path.exists("results"):
-        os.makedirs("results")
-    
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"results/{test_name}_{timestamp}.json"
+    filename = f"{RESULTS_DIR}/{test_name}_{timestamp}.json"
     
     with open(filename, 'w') as f:
         json.dump(results, f, indent=2)
     
     return filename
 
+class ResultsSink:
+    """Collect test results in memory and write them to one JSON Lines file.
+    
+    Use as a context manager; the file is written once, when the block exits.
+    """
+    
+    def __init__(self, run_name="run"):
+        self.run_name = run_name
+        self.records = []
+        self.filename = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
+    
+    def add(self, test_name, results):
+        """Queue the results of a single test."""
+        self.records.append({"test_name": test_name, "results": results})
+    
+    def flush(self):
+        """Write all queued results and return the file name, if any."""
+        if not self.records:
+            return None
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.filename = f"{RESULTS_DIR}/{self.run_name}_{timestamp}.jsonl"
+        
+        with open(self.filename, 'w') as f:
+            f.writelines(json.dumps(record) + "\n" for record in self.records)
+        
+        self.records = []
+        return self.filename
+
+def wait_for(locator, state="visible", timeout=5000):
+    """Wait until a locator reaches the given state, returning as soon as it does."""
+    locator.wait_for(state=state, timeout=timeout)
+
 def wait_seconds(seconds):
-    """Wait for a specified number of seconds."""
+    """Wait for a specified number of seconds.
+    
+    Deprecated: a fixed sleep always burns the full delay. Use wait_for() with
+    the locator the next step depends on instead.
+    """
+    warnings.warn(
+        "wait_seconds() is deprecated; use wait_for() with a locator instead",
+        DeprecationWarning,
+        stacklevel=2,
+    )
     time.sleep(seconds)
 
 # 13. Let's create the test_login.py file:
 
 # tests/test_login.py
+import re
 import pytest
+from playwright.sync_api import expect
 from pages.home_page import HomePage
 from pages.login_page import LoginPage
 from pages.profile_page import ProfilePage
-from utils.test_data import VALID_USER, INVALID_USER
+from utils.test_data import INVALID_USER
 
 class TestLogin:
     """Test cases for login functionality."""
     
     @pytest.fixture(autouse=True)
-    def setup(self, page):
+    def setup(self, page, request):
         """Setup for each test."""
         self.home_page = HomePage(page)
         self.login_page = LoginPage(page)
         self.profile_page = ProfilePage(page)
         
-        self.home_page.navigate()
+        # Only tests covering the home page -> login link pay for the extra page load
+        if request.node.get_closest_marker("home_navigation"):
+            self.home_page.navigate()
+            self.home_page.click_login()
+        else:
+            self.login_page.navigate()
     
     @pytest.mark.smoke
-    def test_valid_login(self, page):
+    @pytest.mark.home_navigation
+    def test_valid_login(self, page, valid_user):
         """Test login with valid credentials."""
-        self.home_page.click_login()
-        self.login_page.login(VALID_USER["email"], VALID_USER["password"])
+        self.login_page.login(valid_user["email"], valid_user["password"])
         
         # Verify successful login (redirected to profile or dashboard)
-        assert "my-bdjobs" in page.url
+        expect(page).to_have_url(re.compile(r"my-bdjobs"))
     
     def test_invalid_login(self):
         """Test login with invalid credentials."""
-        self.home_page.click_login()
         self.login_page.login(INVALID_USER["email"], INVALID_USER["password"])
         
         error_message = self.login_page.get_error_message()
         assert error_message is not None
     
-    def test_logout(self, page):
+    def test_logout(self, page, valid_user):
         """Test logout functionality."""
-        self.home_page.click_login()
-        self.login_page.login(VALID_USER["email"], VALID_USER["password"])
+        self.login_page.login(valid_user["email"], valid_user["password"])
         
         # Verify logged in first
-        assert "my-bdjobs" in page.url
+        expect(page).to_have_url(re.compile(r"my-bdjobs"))
         
         self.profile_page.logout()
         
         # Verify returned to home page or login page
-        assert "my-bdjobs" not in page.url
+        expect(page).not_to_have_url(re.compile(r"my-bdjobs"))
 
 # 14. Let's create the test_search.py file:
 
@@ -590,6 +918,7 @@ from pages.job_search_page import JobSearchPage
 from pages.job_details_page import JobDetailsPage
 from utils.test_data import SEARCH_TERMS, JOB_CATEGORIES, LOCATIONS
 
+@pytest.mark.har
 class TestJobSearch:
     """Test cases for job search functionality."""
     
@@ -645,7 +974,9 @@ class TestJobSearch:
 # 15. Let's create the test_registration.py file:
 
 # tests/test_registration.py
+import re
 import pytest
+from playwright.sync_api import expect
 from pages.home_page import HomePage
 from pages.registration_page import RegistrationPage
 from utils.test_data import NEW_USER
@@ -655,18 +986,22 @@ class TestRegistration:
     """Test cases for user registration."""
     
     @pytest.fixture(autouse=True)
-    def setup(self, page):
+    def setup(self, page, request):
         """Setup for each test."""
         self.home_page = HomePage(page)
         self.registration_page = RegistrationPage(page)
         
-        self.home_page.navigate()
+        # Only tests covering the home page -> registration link pay for the extra page load
+        if request.node.get_closest_marker("home_navigation"):
+            self.home_page.navigate()
+            self.home_page.click_registration()
+        else:
+            self.registration_page.navigate()
     
     @pytest.mark.smoke
+    @pytest.mark.home_navigation
     def test_valid_registration(self, page):
         """Test registration with valid data."""
-        self.home_page.click_registration()
-        
         # Generate a unique email to avoid duplicate registration issues
         random_email = generate_random_email()
         user_data = {**NEW_USER, "email": random_email}
@@ -674,11 +1009,10 @@ class TestRegistration:
         self.registration_page.register_user(user_data)
         
         # Verify successful registration (should be redirected to profile completion or dashboard)
-        assert "my-bdjobs" in page.url
+        expect(page).to_have_url(re.compile(r"my-bdjobs"))
     
     def test_registration_with_existing_email(self):
         """Test registration with an already registered email."""
-        self.home_page.click_registration()
         self.registration_page.register_user(NEW_USER)
         
         errors = self.registration_page.get_error_messages()
@@ -690,8 +1024,6 @@ class TestRegistration:
     
     def test_registration_with_password_mismatch(self):
         """Test registration with mismatched passwords."""
-        self.home_page.click_registration()
-        
         random_email = generate_random_email()
         user_data = {
             **NEW_USER,
@@ -715,38 +1047,28 @@ class TestRegistration:
 
 # tests/test_profile.py
 import pytest
-from pages.home_page import HomePage
-from pages.login_page import LoginPage
 from pages.profile_page import ProfilePage
-from utils.test_data import VALID_USER
 
 class TestProfile:
     """Test cases for user profile functionality."""
     
     @pytest.fixture(autouse=True)
-    def setup(self, page):
+    def setup(self, authed_page):
         """Setup for each test with logged in user."""
-        self.home_page = HomePage(page)
-        self.login_page = LoginPage(page)
-        self.profile_page = ProfilePage(page)
-        
-        # Login before each test
-        self.home_page.navigate()
-        self.home_page.click_login()
-        self.login_page.login(VALID_USER["email"], VALID_USER["password"])
+        # authed_page reuses the session saved by authenticated_storage_state,
+        # so the profile page opens already logged in
+        self.profile_page = ProfilePage(authed_page)
+        self.profile_page.navigate()
     
     @pytest.mark.smoke
     def test_view_profile(self):
         """Test viewing the user profile."""
-        self.profile_page.navigate()
-        
         profile_name = self.profile_page.get_profile_name()
         assert profile_name is not None
         assert len(profile_name) > 0
     
     def test_view_applied_jobs(self):
         """Test viewing applied jobs."""
-        self.profile_page.navigate()
         self.profile_page.view_applied_jobs()
         
         # Verify applied jobs page loaded
@@ -755,9 +1077,379 @@ class TestProfile:
     
     def test_view_saved_jobs(self):
         """Test viewing saved jobs."""
-        self.profile_page.navigate()
         self.profile_page.view_saved_jobs()
         
         # Verify saved jobs page loaded
         current_url = self.profile_page.get_url()
         assert "saved" in current_url
+
+# 17. Let's create the async base_page.py file:
+
+# async_pages/base_page.py
+import logging
+from playwright.async_api import Locator, Page, TimeoutError
+
+class BasePage:
+    """Async counterpart of pages.base_page.BasePage.
+    
+    Locator construction is synchronous in the async API as well, so subclasses
+    reuse the cached_locator declarations of the sync page objects and only the
+    actions become coroutines.
+    """
+    
+    BASE_URL = "https://bdjobs.com"
+    logger = logging.getLogger(__name__)
+    
+    def __init__(self, page: Page):
+        self.page = page
+    
+    async def navigate(self, path=""):
+        """Navigate to a specific URL path."""
+        url = f"{self.BASE_URL}/{path}"
+        self.logger.info(f"Navigating to: {url}")
+        await self.page.goto(url)
+    
+    async def get_title(self):
+        """Get page title."""
+        return await self.page.title()
+    
+    def get_url(self):
+        """Get current URL."""
+        return self.page.url
+    
+    def locator(self, selector):
+        """Return a Locator for a selector string, or the Locator itself."""
+        if isinstance(selector, Locator):
+            return selector
+        return self.page.locator(selector).first
+    
+    async def is_element_visible(self, selector):
+        """Check if an element is visible."""
+        try:
+            return await self.locator(selector).is_visible()
+        except TimeoutError:
+            return False
+    
+    async def click(self, selector):
+        """Click on an element."""
+        await self.locator(selector).click()
+    
+    async def fill(self, selector, text):
+        """Fill a form field."""
+        await self.locator(selector).fill(text)
+    
+    async def select_option(self, selector, value):
+        """Select an option from a dropdown."""
+        await self.locator(selector).select_option(value)
+    
+    async def wait_for_selector(self, selector, state="visible", timeout=10000):
+        """Wait for an element to be in the specified state."""
+        await self.locator(selector).wait_for(state=state, timeout=timeout)
+
+# 18. Let's create the async home_page.py file:
+
+# async_pages/home_page.py
+from async_pages.base_page import BasePage
+from pages import home_page
+
+class HomePage(BasePage):
+    """Async page object for the home page."""
+    
+    search_box = home_page.HomePage.search_box
+    search_button = home_page.HomePage.search_button
+    job_category_links = home_page.HomePage.job_category_links
+    search_results_container = home_page.HomePage.search_results_container
+    
+    async def navigate(self):
+        """Navigate to the home page."""
+        await super().navigate()
+    
+    async def search_job(self, keyword):
+        """Search for a job using a keyword."""
+        await self.fill(self.search_box, keyword)
+        await self.click(self.search_button)
+        await self.wait_for_selector(self.search_results_container)
+    
+    async def select_job_category(self, category):
+        """Select a job category."""
+        await self.click(self.job_category_links.filter(has_text=category).first)
+        await self.wait_for_selector(self.search_results_container)
+
+# 19. Let's create the async job_search_page.py file:
+
+# async_pages/job_search_page.py
+from playwright.async_api import expect
+from async_pages.base_page import BasePage
+from pages import job_search_page
+
+class JobSearchPage(BasePage):
+    """Async page object for the job search page."""
+    
+    job_titles = job_search_page.JobSearchPage.job_titles
+    location_filter = job_search_page.JobSearchPage.location_filter
+    total_jobs_count = job_search_page.JobSearchPage.total_jobs_count
+    
+    async def get_search_results_count(self):
+        """Get the number of search results."""
+        count_text = await self.total_jobs_count.text_content()
+        # Extract numbers from text like "1,234 jobs found"
+        numbers = job_search_page.DIGITS_RE.findall(count_text.replace(',', ''))
+        if numbers:
+            return int(numbers[0])
+        return 0
+    
+    async def filter_by_location(self, location):
+        """Filter jobs by location."""
+        # Same signal as the sync page: the count may legitimately not change
+        async with self.page.expect_response(job_search_page.is_search_results_response):
+            await self.click(self.location_filter.locator("label", has_text=location).first)
+    
+    async def click_on_job_by_index(self, index):
+        """Click on a job by index in the search results."""
+        await self.job_titles.nth(index).click()
+        await expect(self.page).to_have_url(job_search_page.JOB_DETAILS_URL_RE)
+
+# 20. Let's create the async job_details_page.py file:
+
+# async_pages/job_details_page.py
+from async_pages.base_page import BasePage
+from pages import job_details_page
+
+class JobDetailsPage(BasePage):
+    """Async page object for the job details page."""
+    
+    job_title = job_details_page.JobDetailsPage.job_title
+    
+    async def get_job_title(self):
+        """Get the job title from the job details page."""
+        return await self.job_title.text_content()
+
+# 21. Let's create the async conftest.py file:
+
+# async_tests/conftest.py
+import asyncio
+import pytest
+import pytest_asyncio
+from playwright.async_api import async_playwright
+from utils.context_setup import (
+    DEFAULT_TIMEOUT,
+    HAR_URL_FILTER,
+    har_record_args,
+    har_replay_path,
+    is_unneeded_request,
+    should_block_assets,
+)
+
+# These async fixtures let one worker drive many pages concurrently on one
+# event loop. Run this suite in its own invocation (`pytest async_tests`):
+# once pytest-playwright's sync fixtures start, Playwright's loop is the running
+# loop and pytest-asyncio can no longer drive its own, so async_tests is kept
+# out of the default testpaths.
+
+async def _block_unneeded_requests(route):
+    """Abort static assets and trackers; hand every other request on."""
+    if is_unneeded_request(route.request):
+        await route.abort()
+    else:
+        await route.fallback()
+
+async def _prepare_context(context, node=None):
+    """Apply the same settings as the sync suite's contexts."""
+    # Set default navigation timeout
+    context.set_default_timeout(DEFAULT_TIMEOUT)
+    
+    if should_block_assets():
+        await context.route("**/*", _block_unneeded_requests)
+    
+    replay_path = har_replay_path(node) if node is not None else None
+    if replay_path:
+        await context.route_from_har(replay_path, url=HAR_URL_FILTER, not_found="fallback")
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """Share one event loop across the session so the browser can be reused."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+@pytest_asyncio.fixture(scope="session")
+async def async_browser(browser_name, browser_type_launch_args):
+    """Launch one browser per worker and share it across all async tests."""
+    async with async_playwright() as playwright:
+        browser = await getattr(playwright, browser_name).launch(**browser_type_launch_args)
+        yield browser
+        await browser.close()
+
+@pytest_asyncio.fixture
+async def async_context(async_browser, browser_context_args, request):
+    """Create a new browser context for an async test."""
+    context = await async_browser.new_context(
+        **browser_context_args,
+        **har_record_args(request.node),
+    )
+    await _prepare_context(context, request.node)
+    
+    yield context
+    await context.close()
+
+@pytest_asyncio.fixture
+async def new_async_context(async_browser, browser_context_args):
+    """Return a factory for extra prepared contexts, closed after the test."""
+    contexts = []
+    
+    async def factory():
+        context = await async_browser.new_context(**browser_context_args)
+        await _prepare_context(context)
+        contexts.append(context)
+        return context
+    
+    yield factory
+    for context in contexts:
+        await context.close()
+
+@pytest_asyncio.fixture
+async def async_page(async_context):
+    """Create a new page in the async browser context."""
+    page = await async_context.new_page()
+    yield page
+
+# 22. Let's create the async test_search.py file:
+
+# async_tests/test_search.py
+import asyncio
+import pytest
+import pytest_asyncio
+from async_pages.home_page import HomePage
+from async_pages.job_search_page import JobSearchPage
+from async_pages.job_details_page import JobDetailsPage
+from utils.test_data import SEARCH_TERMS, JOB_CATEGORIES, LOCATIONS
+
+pytestmark = pytest.mark.asyncio
+
+@pytest_asyncio.fixture
+async def home_page(async_page):
+    """Home page object, already navigated to."""
+    home_page = HomePage(async_page)
+    await home_page.navigate()
+    return home_page
+
+@pytest.fixture
+def search_page(async_page):
+    """Job search page object."""
+    return JobSearchPage(async_page)
+
+@pytest.fixture
+def details_page(async_page):
+    """Job details page object."""
+    return JobDetailsPage(async_page)
+
+@pytest.mark.har
+class TestJobSearch:
+    """Async test cases for job search functionality."""
+    
+    @pytest.mark.smoke
+    async def test_search_by_keyword(self, home_page, search_page):
+        """Test search for jobs by keyword."""
+        await home_page.search_job(SEARCH_TERMS[0])
+        
+        results_count = await search_page.get_search_results_count()
+        assert results_count > 0
+    
+    async def test_filter_search_results(self, home_page, search_page):
+        """Test filtering search results."""
+        await home_page.search_job(SEARCH_TERMS[0])
+        
+        # Both counts come from the same page, so these steps stay sequential
+        initial_count = await search_page.get_search_results_count()
+        await search_page.filter_by_location(LOCATIONS[0])
+        
+        filtered_count = await search_page.get_search_results_count()
+        # Filtered results should be less than or equal to initial results
+        assert filtered_count <= initial_count
+    
+    async def test_view_job_details(self, home_page, search_page, details_page):
+        """Test viewing job details."""
+        await home_page.search_job(SEARCH_TERMS[0])
+        await search_page.click_on_job_by_index(0)
+        
+        job_title = await details_page.get_job_title()
+        assert job_title is not None
+        assert len(job_title) > 0
+    
+    async def test_browse_by_category(self, home_page, search_page):
+        """Test browsing jobs by category."""
+        await home_page.select_job_category(JOB_CATEGORIES[0])
+        
+        results_count = await search_page.get_search_results_count()
+        assert results_count > 0
+    
+    async def test_search_all_terms_concurrently(self, new_async_context):
+        """Test that every search term returns results, searching them all at once."""
+        
+        async def search_results_count(term):
+            context = await new_async_context()
+            page = await context.new_page()
+            home_page = HomePage(page)
+            await home_page.navigate()
+            await home_page.search_job(term)
+            return await JobSearchPage(page).get_search_results_count()
+        
+        counts = await asyncio.gather(*(search_results_count(term) for term in SEARCH_TERMS))
+        assert all(count > 0 for count in counts)
+
+# 23. Let's create the context_setup.py file:
+
+# utils/context_setup.py
+"""Browser context settings shared by the sync and async test suites."""
+import os
+
+# Default timeout for actions and navigations, in milliseconds
+DEFAULT_TIMEOUT = 30000
+
+# Requests no assertion depends on; set FULL_ASSETS=1 to load them anyway
+# (e.g. for visual checks).
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+BLOCKED_HOSTS = ("googletagmanager", "google-analytics", "facebook", "doubleclick")
+
+# Tests marked `har` can record their API traffic once (HAR_MODE=record) and
+# replay it on later runs (HAR_MODE=replay) instead of hitting the live site.
+HAR_DIR = "hars"
+HAR_URL_FILTER = "**/api/**"
+
+def should_block_assets():
+    """Return whether static assets and trackers should be blocked."""
+    return os.getenv("FULL_ASSETS") != "1"
+
+def is_unneeded_request(request):
+    """Return whether a request is a static asset or tracker no test needs."""
+    return request.resource_type in BLOCKED_RESOURCE_TYPES or any(host in request.url for host in BLOCKED_HOSTS)
+
+def har_mode(node):
+    """Return HAR_MODE ("record" or "replay") for test items marked `har`, else None."""
+    if node.get_closest_marker("har"):
+        return os.getenv("HAR_MODE")
+    return None
+
+def har_path(node):
+    """Return the path of the HAR a `har` test records to and replays from."""
+    return os.path.join(HAR_DIR, f"{node.name}.har")
+
+def har_record_args(node):
+    """Return the new_context() arguments that record a `har` test's API traffic."""
+    if har_mode(node) != "record":
+        return {}
+    
+    os.makedirs(HAR_DIR, exist_ok=True)
+    return {
+        "record_har_path": har_path(node),
+        "record_har_url_filter": HAR_URL_FILTER,
+        "record_har_mode": "minimal",
+    }
+
+def har_replay_path(node):
+    """Return the HAR to replay for a `har` test, or None to use the live site."""
+    # Requests missing from the HAR (or a missing HAR) go to the network
+    path = har_path(node)
+    if har_mode(node) == "replay" and os.path.exists(path):
+        return path
+    return None